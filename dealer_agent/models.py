@@ -1,11 +1,15 @@
 """
 Card and game models for the blackjack game.
 This file contains the core data structures used throughout the game.
+
+Cards, hands and evaluations are only ever built by the dealer itself, never
+parsed from untrusted input, so they are plain dataclasses rather than
+Pydantic models to keep validation out of the dealing hot path.
 """
 
-from typing import List
+from typing import List, Tuple, Dict, Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 
 class Suit(str, Enum):
     hearts = 'H'
@@ -28,15 +32,50 @@ class Rank(str, Enum):
     king = 'K'
     ace = 'A'
 
-class Card(BaseModel):
+# Point value of each rank with aces counted as 1.
+RANK_VALUE: Dict[Rank, int] = {
+    Rank.two: 2, Rank.three: 3, Rank.four: 4, Rank.five: 5, Rank.six: 6,
+    Rank.seven: 7, Rank.eight: 8, Rank.nine: 9, Rank.ten: 10,
+    Rank.jack: 10, Rank.queen: 10, Rank.king: 10, Rank.ace: 1,
+}
+
+# Extra points when one ace in a hand counts as 11; at most one ever can.
+ACE_BONUS = 10
+
+@dataclass(frozen=True, slots=True)
+class Card:
     suit: Suit
     rank: Rank
+    # Plain string values of suit and rank, cached at construction because
+    # Enum.value is a comparatively slow descriptor and payloads read it per card.
+    suit_str: str = field(init=False, repr=False, compare=False)
+    rank_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "suit_str", self.suit.value)
+        object.__setattr__(self, "rank_str", self.rank.value)
 
-class HandEvaluation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class HandEvaluation:
     total: int
     is_soft: bool
     is_blackjack: bool
     is_bust: bool
 
-class Hand(BaseModel):
-    cards: List[Card] = Field(default_factory=list) 
\ No newline at end of file
+@dataclass(slots=True)
+class Hand:
+    cards: List[Card] = field(default_factory=list)
+    # Running tallies over the first `counted` cards of `counted_list` (aces
+    # counted as 1), kept up to date by the dealer so evaluating a hand does not
+    # rescan its cards. Cards are only ever appended; assigning a new list to
+    # `cards` triggers a recount, but editing the list in place is not detected.
+    hard_total: int = field(default=0, init=False, repr=False, compare=False)
+    aces: int = field(default=0, init=False, repr=False, compare=False)
+    counted: int = field(default=0, init=False, repr=False, compare=False)
+    counted_list: Optional[List[Card]] = field(default=None, init=False, repr=False, compare=False)
+    # Evaluation of the first `counted` cards, reused until another card is counted.
+    evaluation: Optional[HandEvaluation] = field(default=None, init=False, repr=False, compare=False)
+
+# The 52 distinct cards, built once at import. Cards are immutable, so code that
+# needs a full deck shares these instances rather than constructing new ones.
+CANONICAL_DECK: Tuple[Card, ...] = tuple(Card(suit=s, rank=r) for s in Suit for r in Rank)
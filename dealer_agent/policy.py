@@ -0,0 +1,52 @@
+"""
+Deterministic turn policy for the dealer agent.
+
+Most transitions in a round are fixed by the rules, not by the player: once the
+player stands, busts, reaches 21 or is dealt blackjack, the round can only end
+with playDealerAndSettle(). This module decides those transitions in plain
+Python so the agent can issue the tool call itself instead of spending a model
+round trip on a decision that has only one answer.
+"""
+
+from typing import Any, Dict, Optional
+
+# Tool that plays out the dealer and settles the round
+FINISH_ROUND_TOOL = "playDealerAndSettle"
+
+
+def next_tool(tool_name: str, response: Dict[str, Any]) -> Optional[str]:
+    """
+    Decide the tool that must follow a tool result, if the rules leave no choice.
+
+    Args:
+        tool_name (str): Name of the tool that just returned
+        response (Dict[str, Any]): The tool's response dictionary
+
+    Returns:
+        Optional[str]: The tool to call next, or None when the model should decide
+        (player input is needed, or the previous call failed)
+
+    Example:
+        >>> next_tool("processPlayerAction", {"success": True, "action": "stand", "player_hand": {...}})
+        'playDealerAndSettle'
+        >>> next_tool("processPlayerAction", {"success": True, "action": "hit", "player_hand": {"total": 15, ...}})
+        None
+    """
+    if not response.get("success"):
+        return None
+
+    player_hand = response.get("player_hand") or {}
+
+    if tool_name == "startRoundWithBet":
+        # A dealt blackjack leaves the player nothing to decide
+        if player_hand.get("is_blackjack"):
+            return FINISH_ROUND_TOOL
+    elif tool_name == "processPlayerAction":
+        if (
+            response.get("action") == "stand"
+            or player_hand.get("is_bust")
+            or player_hand.get("total") == 21
+        ):
+            return FINISH_ROUND_TOOL
+
+    return None
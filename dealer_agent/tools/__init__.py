@@ -4,4 +4,65 @@ Tools package for the dealer agent.
 Contains the core dealer logic (dealer.py) for ADK compatibility.
 """
 
-from .dealer import * 
\ No newline at end of file
+from .dealer import (
+    # Tools registered with the dealer agent
+    startRoundWithBet,
+    processPlayerAction,
+    processDealerPlay,
+    settleBet,
+    displayState,
+    getGameStatus,
+    getGameHistory,
+
+    # Game operations
+    initialize_game,
+    shuffleShoe,
+    drawCard,
+    placeBet,
+    evaluateHand,
+    dealInitialHands,
+    checkShoeExhaustion,
+    resetForNextHand,
+    placeBetAndDealInitialHands,
+    playDealerAndSettle,
+
+    # State management
+    GameState,
+    get_current_state,
+    set_current_state,
+    reset_game_state,
+
+    # Errors
+    InsufficientBalanceError,
+    DatabaseError,
+    SessionError,
+    GameStateValidationError,
+)
+
+__all__ = [
+    "startRoundWithBet",
+    "processPlayerAction",
+    "processDealerPlay",
+    "settleBet",
+    "displayState",
+    "getGameStatus",
+    "getGameHistory",
+    "initialize_game",
+    "shuffleShoe",
+    "drawCard",
+    "placeBet",
+    "evaluateHand",
+    "dealInitialHands",
+    "checkShoeExhaustion",
+    "resetForNextHand",
+    "placeBetAndDealInitialHands",
+    "playDealerAndSettle",
+    "GameState",
+    "get_current_state",
+    "set_current_state",
+    "reset_game_state",
+    "InsufficientBalanceError",
+    "DatabaseError",
+    "SessionError",
+    "GameStateValidationError",
+]
@@ -2,7 +2,7 @@ from typing import List, Tuple, Literal, Optional, Dict, Any
 from google.adk.tools.tool_context import ToolContext
 import random
 from enum import Enum
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 import uuid
 from datetime import datetime
 
@@ -23,6 +23,37 @@ class SessionError(Exception):
     """Raised when session operations fail."""
     pass
 
+# Message prefix for the errors a tool reports as expected failures; anything
+# else is reported as unexpected.
+_TOOL_ERROR_PREFIX: Dict[type, str] = {
+    DatabaseError: "Database error: ",
+    SessionError: "Session error: ",
+}
+
+# Bets also surface balance and amount validation errors verbatim.
+_BET_ERROR_PREFIX: Dict[type, str] = {
+    **_TOOL_ERROR_PREFIX,
+    InsufficientBalanceError: "",
+    ValueError: "",
+}
+
+def _error_response(e: Exception, prefixes: Dict[type, str] = _TOOL_ERROR_PREFIX) -> Dict[str, Any]:
+    """
+    Build a failed tool response for an exception raised inside a tool.
+    
+    Args:
+        e (Exception): The exception that ended the tool call
+        prefixes (Dict[type, str]): Message prefix per expected exception type;
+            subclasses match their nearest listed base
+    
+    Returns:
+        Dict[str, Any]: {"success": False, "error": <prefixed message>}
+    """
+    for cls in type(e).__mro__:
+        if cls in prefixes:
+            return {"success": False, "error": f"{prefixes[cls]}{e}"}
+    return {"success": False, "error": f"Unexpected error: {e}"}
+
 """
 @LeraningNotes:
 - Google's ADK framework only supports JSON-serializable simple data types.
@@ -37,14 +68,44 @@ class SessionError(Exception):
 """
 
 # Import models
-from dealer_agent.models import Card, Hand, HandEvaluation, Suit, Rank
+from dealer_agent.models import Card, Hand, HandEvaluation, Rank, CANONICAL_DECK, RANK_VALUE, ACE_BONUS
+
+# Unshuffled contents of a full six-deck shoe. Every shoe shares the canonical
+# card instances instead of constructing 312 new ones per shuffle.
+_SIX_DECKS: Tuple[Card, ...] = CANONICAL_DECK * 6
+
+# Dedicated generator for shuffling, so tests can seed it with reseed() without
+# touching the process-wide random module state.
+_RNG = random.Random()
+
+# Amount credited back per unit bet at settlement. The stake is debited when the
+# bet is placed, so these include returning it: even money pays 2x, blackjack 3:2 pays 2.5x.
+_WIN_PAYOUT = 2.0
+_BLACKJACK_PAYOUT = 2.5
+
+# Largest distance from a whole number of cents that a bet may carry and still be
+# treated as float noise (25.000000001) rather than a sub-cent amount (25.004).
+_CENT_TOLERANCE = 1e-6
+
+RoundOutcome = Literal['win', 'loss', 'push']
 
-class GameState(BaseModel):
+# Dealer keeps drawing below this total and stands on it, soft or hard.
+_DEALER_STAND_TOTAL = 17
+
+# Display label ("AS", "10H", ...) for every card, formatted once at import.
+_CARD_LABEL: Dict[Card, str] = {c: f"{c.rank_str}{c.suit_str}" for c in CANONICAL_DECK}
+
+@dataclass(slots=True)
+class GameState:
     shoe: List[Card]
-    player_hand: Hand = Field(default_factory=Hand)
-    dealer_hand: Hand = Field(default_factory=Hand)
+    player_hand: Hand = field(default_factory=Hand)
+    dealer_hand: Hand = field(default_factory=Hand)
     bet: float = 0.0
     # Note: chips are now managed in database, not in-memory
+    
+    def __post_init__(self):
+        # Own the shoe: dealing pops from it, so never mutate the caller's list
+        self.shoe = list(self.shoe)
 
 
 # ----- Tool Context -----
@@ -57,6 +118,13 @@ def get_current_user_id(tool_context: ToolContext) -> str:
     """Get user ID from tool context."""
     return tool_context.state.get("user_id")
 
+def _require_user_id(tool_context: ToolContext) -> str:
+    """Get user ID from tool context, raising SessionError if it is missing."""
+    user_id = tool_context.state.get("user_id")
+    if not user_id:
+        raise SessionError("User ID not found in session context")
+    return user_id
+
 # ----- User DB Getters -----
 
 async def get_user_wallet_info(tool_context: ToolContext) -> Dict[str, Any]:
@@ -120,7 +188,8 @@ def shuffleShoe() -> List[Card]:
     Initialize or re-shuffle the six-deck shoe.
     
     Creates a standard 52-card deck and duplicates it 6 times to create a shoe
-    used in casino blackjack. The shoe is then shuffled using Python's random.shuffle.
+    used in casino blackjack. The shoe is then shuffled with the module's dedicated
+    random.Random instance (see reseed).
     
     Use this function when:
     - Starting a new game session
@@ -137,11 +206,58 @@ def shuffleShoe() -> List[Card]:
         >>> isinstance(shoe[0], Card)
         True
     """
-    single_deck = [Card(suit=s, rank=r) for s in Suit for r in Rank]
-    shoe = single_deck * 6
-    random.shuffle(shoe)
+    shoe = list(_SIX_DECKS)
+    _RNG.shuffle(shoe)
     return shoe
 
+def _reshuffle_in_place(shoe: List[Card]) -> None:
+    """
+    Refill an existing shoe list with all six decks and shuffle it.
+    
+    Reuses the list the game state already holds instead of allocating a new
+    shoe for every reshuffle.
+    """
+    shoe[:] = _SIX_DECKS
+    _RNG.shuffle(shoe)
+
+def reseed(seed: Optional[int] = None) -> None:
+    """
+    Seed the generator used by shuffleShoe.
+    
+    Passing the same seed makes the following shuffles repeat exactly, which is
+    useful in tests; passing None reseeds from system entropy.
+    
+    Args:
+        seed (Optional[int]): Seed value, or None for a fresh random seed
+        
+    Example:
+        >>> reseed(7)
+        >>> first = shuffleShoe()
+        >>> reseed(7)
+        >>> shuffleShoe() == first
+        True
+    """
+    _RNG.seed(seed)
+
+def _draw_card(state: GameState) -> Card:
+    """
+    Take the top card off the shoe.
+    
+    The end of the shoe list is its top, so the list length doubles as the
+    draw cursor: popping is O(1), mutates the shoe in place without
+    reassigning the field, and len(state.shoe) stays the remaining count.
+    
+    Args:
+        state (GameState): The game state to draw from
+        
+    Returns:
+        Card: The drawn card
+        
+    Raises:
+        IndexError: If the shoe is empty
+    """
+    return state.shoe.pop()
+
 def drawCard() -> Dict[str, Any]:
     """
     Draw the top card from the shoe and add it to the player's hand.
@@ -181,32 +297,16 @@ def drawCard() -> Dict[str, Any]:
     """
     try:
         state = get_current_state()
-        shoe = state.shoe
-        card = shoe.pop()
-        state.shoe = shoe
-        state.player_hand.cards.append(card)
-        set_current_state(state)
+        card = _draw_card(state)
+        add_card(state.player_hand, card)
         
         player_eval = evaluateHand(state.player_hand)
         
-        # Convert to dict format for agent consumption
-        def _card_to_dict(card: Card) -> Dict[str, str]:
-            return {"suit": card.suit.value, "rank": card.rank.value}
-        
-        def _hand_to_dict(hand: Hand) -> Dict[str, Any]:
-            return {
-                "cards": [_card_to_dict(card) for card in hand.cards],
-                "total": evaluateHand(hand).total,
-                "is_soft": evaluateHand(hand).is_soft,
-                "is_blackjack": evaluateHand(hand).is_blackjack,
-                "is_bust": evaluateHand(hand).is_bust
-            }
-        
         return {
             "success": True,
-            "message": f"Drew card: {card.rank.value}{card.suit.value}",
+            "message": f"Drew card: {_CARD_LABEL[card]}",
             "drawn_card": _card_to_dict(card),
-            "player_hand": _hand_to_dict(state.player_hand),
+            "player_hand": _hand_to_dict(state.player_hand, player_eval),
             "player_bust": player_eval.is_bust,
             "player_blackjack": player_eval.is_blackjack,
             "remaining_cards": len(state.shoe)
@@ -255,16 +355,19 @@ async def placeBet(amount: float, tool_context: ToolContext) -> Dict[str, Any]:
         DatabaseError: If database operations fail
     """
     try:
-        # Get user_id from tool context
-        user_id = tool_context.state.get("user_id")
-        if not user_id:
-            raise SessionError("User ID not found in session context")
+        user_id = _require_user_id(tool_context)
         
-        # Validate bet amount
-        if amount <= 0:
+        # Validate bet amount in whole cents, so float noise such as 25.000000001
+        # neither fails the multiple-of-5 check nor reaches the debit, while
+        # sub-cent amounts such as 25.004 are still rejected
+        amount_cents = round(amount * 100)
+        if amount_cents <= 0:
             raise ValueError("Bet amount must be positive.")
-        if amount % 5 != 0:
+        if abs(amount * 100 - amount_cents) > _CENT_TOLERANCE:
+            raise ValueError("Bet amount must be in whole cents.")
+        if amount_cents % 500 != 0:
             raise ValueError("Bet amount must be a multiple of 5.")
+        amount = amount_cents / 100
         
         # Atomic debit operation - PostgreSQL handles concurrency and validation
         if not await service_manager.user_manager.debit_user_balance(user_id, amount):
@@ -284,36 +387,62 @@ async def placeBet(amount: float, tool_context: ToolContext) -> Dict[str, Any]:
             "bet": state.bet,
             "balance": updated_balance
         }
-    except InsufficientBalanceError as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-    except DatabaseError as e:
-        return {
-            "success": False,
-            "error": f"Database error: {str(e)}"
-        }
-    except SessionError as e:
-        return {
-            "success": False,
-            "error": f"Session error: {str(e)}"
-        }
-    except ValueError as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }
+        return _error_response(e, _BET_ERROR_PREFIX)
 
 
 
 # ----- Evaluation -----
 
+def _tally(hand: Hand) -> None:
+    """
+    Fold any cards not yet counted into the hand's running totals.
+    
+    Hands built directly with Hand(cards=[...]) start with nothing counted,
+    so the first evaluation catches up; after that each appended card is
+    folded once. Assigning a new list to hand.cards, or removing cards,
+    triggers a full recount.
+    
+    Args:
+        hand (Hand): The hand whose tallies should be brought up to date
+    """
+    cards = hand.cards
+    if hand.counted_list is not cards or hand.counted > len(cards):
+        # The card list was reassigned or shortened; recount from scratch
+        hand.hard_total = hand.aces = hand.counted = 0
+        hand.counted_list = cards
+    elif hand.counted == len(cards):
+        return
+    for i in range(hand.counted, len(cards)):
+        rank = cards[i].rank
+        hand.hard_total += RANK_VALUE[rank]
+        hand.aces += rank is Rank.ace
+    hand.counted = len(cards)
+    hand.evaluation = None
+
+def _best_total(hand: Hand) -> int:
+    """
+    Best total of an already tallied hand, counting one ace as 11 when that does not bust.
+    
+    Args:
+        hand (Hand): A hand whose running totals are up to date
+    """
+    total = hand.hard_total
+    if hand.aces and total + ACE_BONUS <= 21:
+        return total + ACE_BONUS
+    return total
+
+def add_card(hand: Hand, card: Card) -> None:
+    """
+    Add a card to a hand and update the hand's running totals.
+    
+    Args:
+        hand (Hand): The hand receiving the card
+        card (Card): The card to add
+    """
+    hand.cards.append(card)
+    _tally(hand)
+
 def evaluateHand(hand: Hand) -> HandEvaluation:
     """
     Compute best total <=21, detect soft total, blackjack, or bust.
@@ -353,24 +482,51 @@ def evaluateHand(hand: Hand) -> HandEvaluation:
         >>> eval.is_bust
         False
     """
-    values = []
-    aces = 0
-    for c in hand.cards:
-        if c.rank in (Rank.jack, Rank.queen, Rank.king):
-            values.append(10)
-        elif c.rank == Rank.ace:
-            aces += 1
-        else:
-            values.append(int(c.rank))
+    _tally(hand)
+    if hand.evaluation is not None:
+        return hand.evaluation
+    total = hand.hard_total  # all aces as 1
     # Ace handling
-    total = sum(values) + aces  # all aces as 1
     is_soft = False
-    if aces > 0 and total + 10 <= 21:
-        total += 10
+    if hand.aces > 0 and total + ACE_BONUS <= 21:
+        total += ACE_BONUS
         is_soft = True
     is_blackjack = len(hand.cards) == 2 and total == 21
     is_bust = total > 21
-    return HandEvaluation(total=total, is_soft=is_soft, is_blackjack=is_blackjack, is_bust=is_bust)
+    hand.evaluation = HandEvaluation(total=total, is_soft=is_soft, is_blackjack=is_blackjack, is_bust=is_bust)
+    return hand.evaluation
+
+# ----- Tool Payloads -----
+
+def _card_to_dict(card: Card) -> Dict[str, str]:
+    """Convert a card to the dict format returned to the agent."""
+    return {"suit": card.suit_str, "rank": card.rank_str}
+
+def _hand_to_dict(hand: Hand, ev: Optional[HandEvaluation] = None) -> Dict[str, Any]:
+    """
+    Convert a hand and its evaluation to the dict format returned to the agent.
+    
+    Callers that already evaluated the hand pass the result as `ev`.
+    """
+    if ev is None:
+        ev = evaluateHand(hand)
+    return {
+        "cards": [_card_to_dict(card) for card in hand.cards],
+        "total": ev.total,
+        "is_soft": ev.is_soft,
+        "is_blackjack": ev.is_blackjack,
+        "is_bust": ev.is_bust
+    }
+
+def _state_to_dict(state: GameState, balance: Optional[float]) -> Dict[str, Any]:
+    """Convert a game state and the user's balance to the dict format returned to the agent."""
+    return {
+        "player_hand": _hand_to_dict(state.player_hand),
+        "dealer_hand": _hand_to_dict(state.dealer_hand),
+        "bet": state.bet,
+        "balance": balance,
+        "remaining_cards": len(state.shoe)
+    }
 
 # ----- Dealing -----
 
@@ -409,31 +565,22 @@ def dealInitialHands() -> Dict[str, Any]:
     """
     try:
         state = get_current_state()
-        for _ in range(2):
-            # Draw card for player
-            result = drawCard()
-            if not result["success"]:
-                return result
-            state = get_current_state()
-            
-            # Draw card for dealer
-            card = state.shoe.pop()
-            state.dealer_hand.cards.append(card)
-            set_current_state(state)
-        
-        # Convert to dict format for agent consumption
-        def _card_to_dict(card: Card) -> Dict[str, str]:
-            return {"suit": card.suit.value, "rank": card.rank.value}
-        
-        def _hand_to_dict(hand: Hand) -> Dict[str, Any]:
+        shoe = state.shoe
+        if len(shoe) < 4:
             return {
-                "cards": [_card_to_dict(card) for card in hand.cards],
-                "total": evaluateHand(hand).total,
-                "is_soft": evaluateHand(hand).is_soft,
-                "is_blackjack": evaluateHand(hand).is_blackjack,
-                "is_bust": evaluateHand(hand).is_bust
+                "success": False,
+                "error": "Shoe is empty, cannot draw card"
             }
         
+        # Take all four cards off the tail at once; in draw order they go
+        # player, dealer, player, dealer
+        player_first, dealer_first, player_second, dealer_second = shoe[-1:-5:-1]
+        del shoe[-4:]
+        add_card(state.player_hand, player_first)
+        add_card(state.dealer_hand, dealer_first)
+        add_card(state.player_hand, player_second)
+        add_card(state.dealer_hand, dealer_second)
+        
         return {
             "success": True,
             "message": "Initial hands dealt",
@@ -470,6 +617,7 @@ def processPlayerAction(action: Literal['hit', 'stand']) -> Dict[str, Any]:
         Dict[str, Any]: A dictionary containing:
             - success (bool): True if action was processed successfully
             - message (str): Description of the action taken
+            - action (str): The action that was applied, "hit" or "stand"
             - player_hand (Dict[str, Any]): Updated player hand information
             - player_bust (bool): True if player hand is now bust
             - player_blackjack (bool): True if player hand is now blackjack
@@ -516,30 +664,21 @@ def processPlayerAction(action: Literal['hit', 'stand']) -> Dict[str, Any]:
             }
         
         if action.lower() == 'hit':
-            result = drawCard()
-            if not result["success"]:
-                return result
-            state = get_current_state()
-        
-        # Convert to dict format for agent consumption
-        def _card_to_dict(card: Card) -> Dict[str, str]:
-            return {"suit": card.suit.value, "rank": card.rank.value}
-        
-        def _hand_to_dict(hand: Hand) -> Dict[str, Any]:
-            return {
-                "cards": [_card_to_dict(card) for card in hand.cards],
-                "total": evaluateHand(hand).total,
-                "is_soft": evaluateHand(hand).is_soft,
-                "is_blackjack": evaluateHand(hand).is_blackjack,
-                "is_bust": evaluateHand(hand).is_bust
-            }
+            # Draw straight into the hand; drawCard() would build a payload we discard
+            if not state.shoe:
+                return {
+                    "success": False,
+                    "error": "Shoe is empty, cannot draw card"
+                }
+            add_card(state.player_hand, _draw_card(state))
         
         player_eval = evaluateHand(state.player_hand)
         
         return {
             "success": True,
             "message": f"Player chose to {action.lower()}",
-            "player_hand": _hand_to_dict(state.player_hand),
+            "action": action.lower(),
+            "player_hand": _hand_to_dict(state.player_hand, player_eval),
             "player_bust": player_eval.is_bust,
             "player_blackjack": player_eval.is_blackjack,
             "remaining_cards": len(state.shoe)
@@ -596,7 +735,6 @@ def processDealerPlay() -> Dict[str, Any]:
             }
         
         player_eval = evaluateHand(state.player_hand)
-        dealer_eval = evaluateHand(state.dealer_hand)
         
         # Check if dealer already played
         if not player_eval.is_bust and len(state.dealer_hand.cards) > 2:
@@ -614,32 +752,19 @@ def processDealerPlay() -> Dict[str, Any]:
             # they implicitly stood. In a full implementation, we'd track player actions explicitly.
             pass  # Allow dealer to play
         
-        eval = evaluateHand(state.dealer_hand)
-        while eval.total < 17:
-            card = state.shoe.pop()
-            state.dealer_hand.cards.append(card)
-            eval = evaluateHand(state.dealer_hand)
-        set_current_state(state)
-        
-        # Convert to dict format for agent consumption
-        def _card_to_dict(card: Card) -> Dict[str, str]:
-            return {"suit": card.suit.value, "rank": card.rank.value}
-        
-        def _hand_to_dict(hand: Hand) -> Dict[str, Any]:
-            return {
-                "cards": [_card_to_dict(card) for card in hand.cards],
-                "total": evaluateHand(hand).total,
-                "is_soft": evaluateHand(hand).is_soft,
-                "is_blackjack": evaluateHand(hand).is_blackjack,
-                "is_bust": evaluateHand(hand).is_bust
-            }
+        # Dealer draws until reaching 17, standing on soft 17; the loop reads
+        # the hand's running tallies instead of evaluating it after every card
+        dealer_hand = state.dealer_hand
+        _tally(dealer_hand)
+        while _best_total(dealer_hand) < _DEALER_STAND_TOTAL:
+            add_card(dealer_hand, _draw_card(state))
         
         dealer_eval = evaluateHand(state.dealer_hand)
         
         return {
             "success": True,
             "message": "Dealer play completed",
-            "dealer_hand": _hand_to_dict(state.dealer_hand),
+            "dealer_hand": _hand_to_dict(state.dealer_hand, dealer_eval),
             "dealer_bust": dealer_eval.is_bust,
             "dealer_blackjack": dealer_eval.is_blackjack,
             "remaining_cards": len(state.shoe)
@@ -737,16 +862,19 @@ async def settleBet(tool_context: ToolContext) -> Dict[str, Any]:
         chips_before = await service_manager.user_manager.get_user_balance(user_id)
         
         # Determine payout and result
+        result: RoundOutcome
+        # Naturals are settled before the dealer's bust, so a player blackjack is
+        # always paid 3:2 even if the dealer drew to a bust against it
         if player_eval.is_bust:
             payout, result = 0.0, 'loss'  # Bet already deducted, no additional loss
-        elif dealer_eval.is_bust:
-            payout, result = bet * 2, 'win'  # Get bet back + equal winnings
         elif player_eval.is_blackjack and not dealer_eval.is_blackjack:
-            payout, result = bet * 2.5, 'win'  # Get bet back + 1.5x winnings
+            payout, result = bet * _BLACKJACK_PAYOUT, 'win'
         elif dealer_eval.is_blackjack and not player_eval.is_blackjack:
             payout, result = 0.0, 'loss'  # Bet already deducted, no additional loss
+        elif dealer_eval.is_bust:
+            payout, result = bet * _WIN_PAYOUT, 'win'
         elif player_eval.total > dealer_eval.total:
-            payout, result = bet * 2, 'win'  # Get bet back + equal winnings
+            payout, result = bet * _WIN_PAYOUT, 'win'
         elif player_eval.total < dealer_eval.total:
             payout, result = 0.0, 'loss'  # Bet already deducted, no additional loss
         else:
@@ -786,7 +914,7 @@ async def settleBet(tool_context: ToolContext) -> Dict[str, Any]:
         if not round_saved:
             raise DatabaseError("Failed to save round data")
         
-        # Mark session as completed
+        # Mark session as completed only once the round is saved
         session_completed = await service_manager.db_service.update_session_status(session_id, 'completed')
         if not session_completed:
             raise SessionError("Failed to complete session")
@@ -808,25 +936,12 @@ async def settleBet(tool_context: ToolContext) -> Dict[str, Any]:
             "total_rounds": total_rounds,  # User's lifetime total rounds
             "reshuffled": False  # Could be enhanced to check shoe exhaustion
         }
-    except DatabaseError as e:
-        return {
-            "success": False,
-            "error": f"Database error: {str(e)}"
-        }
-    except SessionError as e:
-        return {
-            "success": False,
-            "error": f"Session error: {str(e)}"
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }
+        return _error_response(e)
 
 # ----- Shoe Check & Reset -----
 
-def checkShoeExhaustion(threshold: int = 50) -> Dict[str, Any]:
+def checkShoeExhaustion(threshold: int = 50, state: Optional[GameState] = None) -> Dict[str, Any]:
     """
     Return True if shoe has fewer than threshold cards.
     
@@ -842,6 +957,8 @@ def checkShoeExhaustion(threshold: int = 50) -> Dict[str, Any]:
     
     Args:
         threshold (int, optional): Minimum number of cards required in shoe. Defaults to 20.
+        state (GameState, optional): State to check; callers that already hold the
+            current state pass it to skip fetching and re-validating it.
         
     Returns:
         bool: True if shoe has fewer cards than threshold, False otherwise
@@ -852,7 +969,8 @@ def checkShoeExhaustion(threshold: int = 50) -> Dict[str, Any]:
         >>> checkShoeExhaustion(threshold=10)
         False
     """
-    state = get_current_state()
+    if state is None:
+        state = get_current_state()
     is_exhausted = len(state.shoe) < threshold
 
     return {
@@ -910,16 +1028,15 @@ def resetForNextHand() -> Dict[str, Any]:
         
         # Reshuffle if needed
         reshuffled = False
-        shoe_check = checkShoeExhaustion()
+        shoe_check = checkShoeExhaustion(state=state)
         if shoe_check["is_exhausted"]:
-            state.shoe = shuffleShoe()
+            _reshuffle_in_place(state.shoe)
             reshuffled = True
         
         # Clear hands and reset bet
         state.player_hand = Hand()
         state.dealer_hand = Hand()
         state.bet = 0.0
-        set_current_state(state)
         
         return {
             "success": True,
@@ -980,45 +1097,32 @@ async def displayState(revealDealerHole: bool = False, tool_context: ToolContext
             if user_id:
                 balance = await service_manager.user_manager.get_user_balance(user_id)
         
+        balance_text = f" | Balance: ${balance}" if balance is not None else ""
+        player_hand_str = ' '.join(_CARD_LABEL[c] for c in state.player_hand.cards)
+        
+        # Evaluate each shown hand once for both the text and the payload
+        p_eval = evaluateHand(state.player_hand)
+        d_eval = evaluateHand(state.dealer_hand) if revealDealerHole else None
+        up_card = state.dealer_hand.cards[0] if state.dealer_hand.cards else None
+        
         # Handle case where dealer hand might be empty
-        if not state.dealer_hand.cards:
-            balance_text = f" | Balance: ${balance}" if balance is not None else ""
-            player_hand_str = hand_to_string(state.player_hand)
-            display_text = f"Player Hand: {player_hand_str} (Total: {evaluateHand(state.player_hand).total}){balance_text}\nDealer Hand: No cards yet"
+        if up_card is None:
+            display_text = f"Player Hand: {player_hand_str} (Total: {p_eval.total}){balance_text}\nDealer Hand: No cards yet"
         else:
-            p_eval = evaluateHand(state.player_hand)
-            balance_text = f" | Balance: ${balance}" if balance is not None else ""
-            player_hand_str = hand_to_string(state.player_hand)
             lines = [f"Player Hand: {player_hand_str} (Total: {p_eval.total}){balance_text}"]
             if revealDealerHole:
-                d_eval = evaluateHand(state.dealer_hand)
-                dealer_hand_str = hand_to_string(state.dealer_hand)
+                dealer_hand_str = ' '.join(_CARD_LABEL[c] for c in state.dealer_hand.cards)
                 lines.append(f"Dealer Hand: {dealer_hand_str} (Total: {d_eval.total})")
             else:
-                up = state.dealer_hand.cards[0]
-                up_card_str = hand_to_string(Hand(cards=[up]))
-                lines.append(f"Dealer Up-Card: {up_card_str}")
+                lines.append(f"Dealer Up-Card: {_CARD_LABEL[up_card]}")
             display_text = '\n'.join(lines)
         
-        # Convert to dict format for agent consumption
-        def _card_to_dict(card: Card) -> Dict[str, str]:
-            return {"suit": card.suit.value, "rank": card.rank.value}
-        
-        def _hand_to_dict(hand: Hand) -> Dict[str, Any]:
-            return {
-                "cards": [_card_to_dict(card) for card in hand.cards],
-                "total": evaluateHand(hand).total,
-                "is_soft": evaluateHand(hand).is_soft,
-                "is_blackjack": evaluateHand(hand).is_blackjack,
-                "is_bust": evaluateHand(hand).is_bust
-            }
-        
         return {
             "success": True,
             "display_text": display_text,
-            "player_hand": _hand_to_dict(state.player_hand),
-            "dealer_hand": _hand_to_dict(state.dealer_hand) if revealDealerHole else None,
-            "dealer_up_card": _card_to_dict(state.dealer_hand.cards[0]) if state.dealer_hand.cards and len(state.dealer_hand.cards) > 0 else None,
+            "player_hand": _hand_to_dict(state.player_hand, p_eval),
+            "dealer_hand": _hand_to_dict(state.dealer_hand, d_eval) if revealDealerHole else None,
+            "dealer_up_card": _card_to_dict(up_card) if up_card is not None else None,
             "balance": balance,
             "bet": state.bet,
             "remaining_cards": len(state.shoe)
@@ -1066,31 +1170,9 @@ async def getGameStatus(tool_context: ToolContext = None) -> Dict[str, Any]:
             if user_id:
                 balance = await service_manager.user_manager.get_user_balance(user_id)
         
-        # Convert to dict format for agent consumption
-        def _card_to_dict(card: Card) -> Dict[str, str]:
-            return {"suit": card.suit.value, "rank": card.rank.value}
-        
-        def _hand_to_dict(hand: Hand) -> Dict[str, Any]:
-            return {
-                "cards": [_card_to_dict(card) for card in hand.cards],
-                "total": evaluateHand(hand).total,
-                "is_soft": evaluateHand(hand).is_soft,
-                "is_blackjack": evaluateHand(hand).is_blackjack,
-                "is_bust": evaluateHand(hand).is_bust
-            }
-        
-        def _state_to_dict(state: GameState) -> Dict[str, Any]:
-            return {
-                "player_hand": _hand_to_dict(state.player_hand),
-                "dealer_hand": _hand_to_dict(state.dealer_hand),
-                "bet": state.bet,
-                "balance": balance,
-                "remaining_cards": len(state.shoe)
-            }
-        
         return {
             "success": True,
-            "game_state": _state_to_dict(state),
+            "game_state": _state_to_dict(state, balance),
             "message": "Current game status retrieved"
         }
     except Exception as e:
@@ -1128,10 +1210,7 @@ async def getGameHistory(tool_context: ToolContext) -> Dict[str, Any]:
             - error (str): Error message if history retrieval failed
     """
     try:
-        # Get user_id from tool context
-        user_id = tool_context.state.get("user_id")
-        if not user_id:
-            raise SessionError("User ID not found in session context")
+        user_id = _require_user_id(tool_context)
         
         # Get user's current balance
         current_balance = await service_manager.user_manager.get_user_balance(user_id)
@@ -1165,21 +1244,8 @@ async def getGameHistory(tool_context: ToolContext) -> Dict[str, Any]:
             "statistics": statistics,
             "message": f"Retrieved history of {len(rounds)} rounds"
         }
-    except DatabaseError as e:
-        return {
-            "success": False,
-            "error": f"Database error: {str(e)}"
-        }
-    except SessionError as e:
-        return {
-            "success": False,
-            "error": f"Session error: {str(e)}"
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }
+        return _error_response(e)
 
 # Note: I/O functions promptUser and logGame should be implemented in the agent layer.
 
@@ -1222,8 +1288,7 @@ def _validate_player_turn_ready(state: GameState) -> bool:
     if state.bet <= 0:
         return False
     
-    player_eval = evaluateHand(state.player_hand)
-    return not player_eval.is_bust
+    return not evaluateHand(state.player_hand).is_bust
 
 def _validate_dealer_turn_ready(state: GameState) -> bool:
     """
@@ -1243,12 +1308,9 @@ def _validate_dealer_turn_ready(state: GameState) -> bool:
     if not _validate_initial_hands_dealt(state):
         return False
     
-    player_eval = evaluateHand(state.player_hand)
-    dealer_eval = evaluateHand(state.dealer_hand)
-    
     # Player must be done (busted or stood)
     # We can't easily detect "stood" but we can assume if player didn't bust and dealer hasn't played, they stood
-    return player_eval.is_bust or len(state.dealer_hand.cards) == 2
+    return len(state.dealer_hand.cards) == 2 or evaluateHand(state.player_hand).is_bust
 
 def _validate_settlement_ready(state: GameState) -> bool:
     """
@@ -1270,15 +1332,12 @@ def _validate_settlement_ready(state: GameState) -> bool:
     if state.bet <= 0:
         return False
     
-    player_eval = evaluateHand(state.player_hand)
-    dealer_eval = evaluateHand(state.dealer_hand)
-    
     # Player is done if busted
-    if player_eval.is_bust:
+    if evaluateHand(state.player_hand).is_bust:
         return True
     
     # Dealer should have played (total >= 17) if player didn't bust
-    return dealer_eval.total >= 17
+    return evaluateHand(state.dealer_hand).total >= 17
 
 def _validate_game_state_consistency(state: GameState) -> Tuple[bool, str]:
     """
@@ -1295,24 +1354,29 @@ def _validate_game_state_consistency(state: GameState) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (is_valid, error_message)
     """
-    # Check shoe count (should be between 0 and 312 for 6-deck shoe)
-    if len(state.shoe) < 0 or len(state.shoe) > 312:
-        return False, f"Invalid shoe count: {len(state.shoe)}"
+    shoe_count = len(state.shoe)
+    player_count = len(state.player_hand.cards)
+    dealer_count = len(state.dealer_hand.cards)
+    
+    # Check shoe count (should be at most 312 for 6-deck shoe)
+    if shoe_count > 312:
+        return False, f"Invalid shoe count: {shoe_count}"
     
     # Check for extreme card count mismatches (only fail on obvious corruption)
-    total_dealt = len(state.player_hand.cards) + len(state.dealer_hand.cards)
-    total_cards = total_dealt + len(state.shoe)
+    total_dealt = player_count + dealer_count
+    total_cards = total_dealt + shoe_count
     
     # Only fail if we have way too many cards (obvious corruption)
     if total_cards > 320:  # Allow some tolerance for test scenarios
-        return False, f"Card count corruption: dealt={total_dealt}, remaining={len(state.shoe)}, total={total_cards}"
+        return False, f"Card count corruption: dealt={total_dealt}, remaining={shoe_count}, total={total_cards}"
     
-    # Validate hand evaluations
+    # Validate hand evaluations; evaluateHand returns a hand's cached
+    # evaluation, so this only tallies cards dealt since the last evaluation
     try:
-        if state.player_hand.cards:
-            player_eval = evaluateHand(state.player_hand)
-        if state.dealer_hand.cards:
-            dealer_eval = evaluateHand(state.dealer_hand)
+        if player_count:
+            evaluateHand(state.player_hand)
+        if dealer_count:
+            evaluateHand(state.dealer_hand)
     except Exception as e:
         return False, f"Hand evaluation error: {str(e)}"
     
@@ -1351,15 +1415,14 @@ async def startRoundWithBet(amount: float, tool_context: ToolContext) -> Dict[st
             - error (str): Error message if any operation failed
     """
     try:
-        user_id = tool_context.state.get("user_id")
-        if not user_id:
-            raise SessionError("User ID not found in session context")
+        user_id = _require_user_id(tool_context)
         
         # Store original balance for potential rollback
         original_balance = await service_manager.user_manager.get_user_balance(user_id)
         
-        # Step 1: Initialize game (creates fresh state and shoe)
-        init_result = await initialize_game(tool_context)
+        # Step 1: Initialize game (creates fresh state and shoe). No tool context,
+        # so it does not fetch the balance we already hold.
+        init_result = await initialize_game()
         if not init_result["success"]:
             return {
                 "success": False,
@@ -1369,7 +1432,7 @@ async def startRoundWithBet(amount: float, tool_context: ToolContext) -> Dict[st
         
         try:
             # Step 2: Place bet and deal initial hands atomically
-            bet_deal_result = await placeBetAndDealInitialHands(amount, tool_context)
+            bet_deal_result = await placeBetAndDealInitialHands(amount, tool_context, balance=original_balance)
             if not bet_deal_result["success"]:
                 # placeBetAndDealInitialHands handles its own rollback,
                 # but we should reset the game state since we initialized it
@@ -1381,6 +1444,9 @@ async def startRoundWithBet(amount: float, tool_context: ToolContext) -> Dict[st
                     "balance": original_balance
                 }
             
+            # Refund exactly what was debited
+            amount = bet_deal_result["bet"]
+            
             # Step 3: Final validation of complete game state
             state = get_current_state()
             if not _validate_player_turn_ready(state):
@@ -1435,7 +1501,7 @@ async def startRoundWithBet(amount: float, tool_context: ToolContext) -> Dict[st
             "balance": original_balance if 'original_balance' in locals() else None
         }
 
-async def placeBetAndDealInitialHands(amount: float, tool_context: ToolContext) -> Dict[str, Any]:
+async def placeBetAndDealInitialHands(amount: float, tool_context: ToolContext, balance: Optional[float] = None) -> Dict[str, Any]:
     """
     Atomically place bet and deal initial hands, with rollback on failure.
     
@@ -1451,6 +1517,8 @@ async def placeBetAndDealInitialHands(amount: float, tool_context: ToolContext)
     Args:
         amount (float): The amount to bet
         tool_context (ToolContext): Tool context containing user_id and session_id
+        balance (Optional[float]): User balance before the bet, if the caller already
+            fetched it; skips fetching it again
         
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -1464,19 +1532,21 @@ async def placeBetAndDealInitialHands(amount: float, tool_context: ToolContext)
             - error (str): Error message if operations failed
     """
     try:
-        # Get user_id from tool context
-        user_id = tool_context.state.get("user_id")
-        if not user_id:
-            raise SessionError("User ID not found in session context")
+        user_id = _require_user_id(tool_context)
         
-        # Store original balance for potential rollback
-        original_balance = await service_manager.user_manager.get_user_balance(user_id)
+        # Store original balance for potential rollback, unless the caller passed it
+        original_balance = balance
+        if original_balance is None:
+            original_balance = await service_manager.user_manager.get_user_balance(user_id)
         
         # Step 1: Place bet (this will debit the user's balance)
         bet_result = await placeBet(amount, tool_context)
         if not bet_result["success"]:
             return bet_result  # Return the bet placement error directly
         
+        # Refund exactly what was debited
+        amount = bet_result["bet"]
+        
         try:
             # Step 2: Deal initial hands
             deal_result = dealInitialHands()
@@ -1542,6 +1612,62 @@ async def placeBetAndDealInitialHands(amount: float, tool_context: ToolContext)
             "error": f"Unexpected error in placeBetAndDealInitialHands: {str(e)}"
         }
 
+async def playDealerAndSettle(tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Finish a round atomically: play out the dealer's hand if needed, then settle the bet.
+    
+    Once the player stands, reaches 21, has blackjack or busts, the remaining steps
+    have no decisions left in them. This runs processDealerPlay() (skipped when the
+    player busted, has blackjack or the dealer has already played) and settleBet()
+    in a single call, so the round finishes in one tool call instead of two.
+    
+    Use this function when:
+    - The player has stood, reached 21 or has blackjack
+    - The player has busted
+    - A round ended without being settled
+    
+    Args:
+        tool_context (ToolContext): Tool context containing user_id and session_id
+        
+    Returns:
+        Dict[str, Any]: Everything settleBet() returns, plus:
+            - dealer_played (bool): True if the dealer drew in this call
+            - dealer_hand (Dict[str, Any]): Dealer's final hand, when the dealer played
+            - dealer_bust (bool): True if the dealer busted, when the dealer played
+            - error (str): Error message if dealer play or settlement failed
+    """
+    try:
+        state = get_current_state()
+        
+        if not _validate_initial_hands_dealt(state):
+            return {
+                "success": False,
+                "error": "Cannot finish round: Initial hands have not been dealt properly. Please start a round with startRoundWithBet first."
+            }
+        
+        # Dealer only plays if the player is still standing without a natural and
+        # it has not drawn yet; a dealt blackjack settles against the dealer's two cards
+        player_eval = evaluateHand(state.player_hand)
+        dealer_result = None
+        if not (player_eval.is_bust or player_eval.is_blackjack) and len(state.dealer_hand.cards) == 2:
+            dealer_result = processDealerPlay()
+            if not dealer_result["success"]:
+                return dealer_result
+        
+        settle_result = await settleBet(tool_context)
+        
+        result = dict(settle_result)
+        result["dealer_played"] = dealer_result is not None
+        if dealer_result is not None:
+            result["dealer_hand"] = dealer_result["dealer_hand"]
+            result["dealer_bust"] = dealer_result["dealer_bust"]
+        return result
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Unexpected error in playDealerAndSettle: {str(e)}"
+        }
+
 # ----- State Management -----
 
 # Global state to maintain the game state across function calls
@@ -1575,6 +1701,9 @@ def set_current_state(state: GameState) -> None:
     """
     Set the global state.
     
+    Only needed to install a new GameState; get_current_state() returns the
+    live object, so changes made to it in place are already visible.
+    
     Args:
         state (GameState): The game state to set
     """
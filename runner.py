@@ -1,13 +1,16 @@
 from google.adk.sessions import DatabaseSessionService, Session
 from google.adk.runners import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.agents import Agent
 from google.adk.tools.tool_context import ToolContext
 from google.adk.models.lite_llm import LiteLlm
 from google.genai import types
 import uuid
+import httpx
+import litellm
 from config import get_config
 import asyncio
-from dealer_agent.agent import dealer_agent
+from dealer_agent.agent import get_dealer_agent
 from services.service_manager import service_manager
 
 # check if user exists, if not, create user, unique ID is twitter username
@@ -22,11 +25,15 @@ user_id = "encrypred8532"  # This would be the Twitter username or unique identi
 tweet_id = "123456"
 
 runner = Runner(
-    agent=dealer_agent,
+    agent=get_dealer_agent(),
     app_name=app_name,
     session_service=session_service
 )
 
+# Stream model output so the reply starts printing with its first tokens
+# instead of after the whole response has been generated
+run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
 async def ensure_user_and_session() -> Session:
     """
     Ensure user exists and create session if needed.
@@ -80,9 +87,17 @@ async def call_agent_async(query: str, session: Session):
         async for event in runner.run_async(
             user_id=user_id, 
             session_id=session.id, 
-            new_message=message
+            new_message=message,
+            run_config=run_config
         ):
-            if event.is_final_response():
+            if event.partial:
+                # Streamed chunk of the reply
+                if event.content and event.content.parts:
+                    for part in event.content.parts:
+                        if part.text:
+                            print(part.text, end="", flush=True)
+            elif event.is_final_response():
+                print()
                 print(event)
             
     except Exception as e:
@@ -95,6 +110,13 @@ async def interactive_chat():
     print("Type 'exit()' to quit the chat.")
     print("=" * 50)
     
+    # Share one pooled async HTTP client across all model calls so later turns
+    # reuse keep-alive connections instead of paying DNS and TLS setup again
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=200, keepalive_expiry=60)
+    )
+    litellm.aclient_session = http_client
+    
     try:
         # Initialize services
         await service_manager.initialize()
@@ -133,6 +155,9 @@ async def interactive_chat():
     except Exception as e:
         print(f"❌ Failed to initialize session: {e}")
         return
+    finally:
+        litellm.aclient_session = None
+        await http_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(interactive_chat())
@@ -5,7 +5,7 @@ Handles conversion between Card objects and string format.
 
 import json
 from typing import List, Dict, Any
-from dealer_agent.models import Card, Hand, Suit, Rank
+from dealer_agent.models import Card, Hand, Suit, Rank, CANONICAL_DECK
 
 def card_to_string(card: Card) -> str:
     """
@@ -17,7 +17,13 @@ def card_to_string(card: Card) -> str:
     Returns:
         str: Card in "AS" format (Ace of Spades)
     """
-    return f"{card.rank.value}{card.suit.value}"
+    return f"{card.rank_str}{card.suit_str}"
+
+# Lookup tables from storage strings to enums and to the shared canonical cards,
+# so parsing a stored hand allocates no new Card objects.
+_RANK_BY_STRING: Dict[str, Rank] = {r.value: r for r in Rank}
+_SUIT_BY_STRING: Dict[str, Suit] = {s.value: s for s in Suit}
+_CARD_BY_STRING: Dict[str, Card] = {card_to_string(c): c for c in CANONICAL_DECK}
 
 def string_to_card(card_str: str) -> Card:
     """
@@ -32,6 +38,10 @@ def string_to_card(card_str: str) -> Card:
     Raises:
         ValueError: If card string format is invalid
     """
+    card = _CARD_BY_STRING.get(card_str)
+    if card is not None:
+        return card
+    
     if len(card_str) < 2:
         raise ValueError(f"Invalid card string format: {card_str}")
     
@@ -43,24 +53,12 @@ def string_to_card(card_str: str) -> Card:
         rank_str = card_str[0]
         suit_str = card_str[1]
     
-    # Convert rank string to Rank enum
-    rank_map = {
-        '2': Rank.two, '3': Rank.three, '4': Rank.four, '5': Rank.five,
-        '6': Rank.six, '7': Rank.seven, '8': Rank.eight, '9': Rank.nine,
-        '10': Rank.ten, 'J': Rank.jack, 'Q': Rank.queen, 'K': Rank.king, 'A': Rank.ace
-    }
-    
-    # Convert suit string to Suit enum
-    suit_map = {
-        'H': Suit.hearts, 'D': Suit.diamonds, 'C': Suit.clubs, 'S': Suit.spades
-    }
-    
-    if rank_str not in rank_map:
+    if rank_str not in _RANK_BY_STRING:
         raise ValueError(f"Invalid rank: {rank_str}")
-    if suit_str not in suit_map:
+    if suit_str not in _SUIT_BY_STRING:
         raise ValueError(f"Invalid suit: {suit_str}")
     
-    return Card(rank=rank_map[rank_str], suit=suit_map[suit_str])
+    return _CARD_BY_STRING[rank_str + suit_str]
 
 def hand_to_string(hand: Hand) -> str:
     """
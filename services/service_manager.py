@@ -3,19 +3,23 @@ Service manager for handling database and user manager initialization.
 This provides a centralized way to access services throughout the application.
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from .db import DatabaseService
 from .user_manager import UserManager
-from .wallet import WalletService
 from config import get_config
 
+if TYPE_CHECKING:
+    # The wallet stack pulls in web3 and privy (over a second to import), so it
+    # is only loaded once initialize() actually builds the wallet service.
+    from .wallet import WalletService
+
 class ServiceManager:
     """Manages database, user manager, and wallet services."""
     
     _instance: Optional['ServiceManager'] = None
     _db_service: Optional[DatabaseService] = None
     _user_manager: Optional[UserManager] = None
-    _wallet_service: Optional[WalletService] = None
+    _wallet_service: Optional['WalletService'] = None
     _initialized: bool = False
     
     def __new__(cls):
@@ -34,6 +38,7 @@ class ServiceManager:
             self._db_service = DatabaseService()
             await self._db_service.init_database(database_url=database_url or config.database.url)
             self._user_manager = UserManager(self._db_service)
+            from .wallet import WalletService
             self._wallet_service = WalletService(
                 app_id=config.privy.app_id,
                 app_secret=config.privy.app_secret,
@@ -60,7 +65,7 @@ class ServiceManager:
         return self._user_manager
     
     @property
-    def wallet_service(self) -> WalletService:
+    def wallet_service(self) -> 'WalletService':
         """Get the wallet service."""
         if not self._initialized:
             raise RuntimeError("ServiceManager not initialized. Call initialize() first.")
@@ -105,12 +105,11 @@ class UserManager:
             ValueError: If user not found
         """
         try:
-            user_id = await self._get_user_id_by_username(username)
             async with self.db_service.get_connection() as conn:
                 async with conn.cursor() as cursor:
                     await cursor.execute("""
-                        SELECT current_balance FROM users WHERE user_id = %s
-                    """, (user_id,))
+                        SELECT current_balance FROM users WHERE username = %s
+                    """, (username,))
                     
                     result = await cursor.fetchone()
                     if not result:
@@ -137,15 +136,18 @@ class UserManager:
             raise ValueError("Amount to debit must be greater than 0")
         
         try:
-            user_id = await self._get_user_id_by_username(username)
             async with self.db_service.get_connection() as conn:
                 async with conn.cursor() as cursor:
+                    # Resolve the user in the same statement to save a round trip
                     await cursor.execute("""
-                        SELECT debit_user_balance(%s::UUID, %s::DECIMAL(15,2))
-                    """, (user_id, amount))
+                        SELECT debit_user_balance(user_id, %s::DECIMAL(15,2))
+                        FROM users WHERE username = %s
+                    """, (amount, username))
                     
                     result = await cursor.fetchone()
                     await conn.commit()
+                    if not result:
+                        raise ValueError(f"User not found: {username}")
                     
                     if result[0]:
                         logger.info(f"Debited {amount} from user {username}")
@@ -173,15 +175,18 @@ class UserManager:
             raise ValueError("Amount to credit must be greater than 0")
 
         try:
-            user_id = await self._get_user_id_by_username(username)
             async with self.db_service.get_connection() as conn:
                 async with conn.cursor() as cursor:
+                    # Resolve the user in the same statement to save a round trip
                     await cursor.execute("""
-                        SELECT credit_user_balance(%s::UUID, %s::DECIMAL(15,2))
-                    """, (user_id, amount))
+                        SELECT credit_user_balance(user_id, %s::DECIMAL(15,2))
+                        FROM users WHERE username = %s
+                    """, (amount, username))
                     
                     result = await cursor.fetchone()
                     await conn.commit()
+                    if not result:
+                        raise ValueError(f"User not found: {username}")
                     
                     if result[0]:
                         logger.info(f"Credited {amount} to user {username}")
@@ -121,13 +121,10 @@ async def test_data_manager(clean_database):
     """
     # Set up test environment and reload config
     from tests.test_helpers import setup_test_environment
-    from config import reload_config, config
+    from config import reload_config
     
     setup_test_environment()
     
-    # Force config reload by clearing the global config
-    import config as config_module
-    config_module.config = None
     reload_config()  # Reload config with test environment variables
     
     # Ensure service manager is reset before creating test data
@@ -240,7 +237,8 @@ def sample_game_state():
     
     Creates a sample game state for testing game logic.
     """
-    from dealer_agent.tools.dealer import GameState, Hand, Card, Suit, Rank
+    from dealer_agent.tools.dealer import GameState
+    from dealer_agent.models import Hand, Card, Suit, Rank
     
     # Create sample cards
     player_cards = [
@@ -260,9 +258,7 @@ def sample_game_state():
         shoe=shoe,
         player_hand=Hand(cards=player_cards),
         dealer_hand=Hand(cards=dealer_cards),
-        bet=25.0,
-        chips=75.0,
-        history=[]
+        bet=25.0
     )
 
 
@@ -273,7 +269,7 @@ def sample_hand():
     
     Creates a sample hand for testing hand evaluation.
     """
-    from dealer_agent.tools.dealer import Hand, Card, Suit, Rank
+    from dealer_agent.models import Hand, Card, Suit, Rank
     
     cards = [
         Card(suit=Suit.hearts, rank=Rank.ten),
@@ -290,7 +286,7 @@ def sample_card():
     
     Creates a sample card for testing card operations.
     """
-    from dealer_agent.tools.dealer import Card, Suit, Rank
+    from dealer_agent.models import Card, Suit, Rank
     
     return Card(suit=Suit.hearts, rank=Rank.ace)
 
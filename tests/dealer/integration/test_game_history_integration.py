@@ -2,10 +2,11 @@ import pytest
 from unittest.mock import Mock
 from dealer_agent.tools.dealer import (
     getGameHistory, initialize_game, placeBet, dealInitialHands, 
-    settleBet, resetForNextHand, reset_game_state, GameState, Hand, 
-    Card, Suit, Rank, shuffleShoe, set_current_state, processDealerPlay, 
+    settleBet, resetForNextHand, reset_game_state, GameState, 
+    shuffleShoe, set_current_state, processDealerPlay, 
     evaluateHand, get_current_state
 )
+from dealer_agent.models import Hand, Card, Suit, Rank
 
 
 @pytest.mark.docker
@@ -1,9 +1,10 @@
 import pytest
 from unittest.mock import Mock
 from dealer_agent.tools.dealer import (
-    getGameStatus, GameState, Hand, Card, Suit, Rank, shuffleShoe, 
+    getGameStatus, GameState, shuffleShoe, 
     set_current_state, reset_game_state
 )
+from dealer_agent.models import Hand, Card, Suit, Rank
 
 
 @pytest.mark.docker
@@ -1,9 +1,10 @@
 import pytest
 from unittest.mock import Mock
 from dealer_agent.tools.dealer import (
-    placeBet, settleBet, GameState, Hand, Card, Suit, Rank, 
+    placeBet, settleBet, GameState, 
     shuffleShoe, set_current_state, reset_game_state
 )
+from dealer_agent.models import Hand, Card, Suit, Rank
 from tests.test_helpers import setup_test_environment
 
 
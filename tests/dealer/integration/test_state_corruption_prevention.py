@@ -8,15 +8,12 @@ from dealer_agent.tools.dealer import (
     displayState,
     GameState,
     shuffleShoe,
-    Card,
-    Suit,
-    Rank,
-    Hand,
     reset_game_state,
     get_current_state,
     set_current_state,
     _validate_game_state_consistency
 )
+from dealer_agent.models import Card, Suit, Rank, Hand
 from google.adk.tools.tool_context import ToolContext
 
 
@@ -0,0 +1,88 @@
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+from dealer_agent.agent import get_dealer_agent, DEALER_INSTRUCTION, _call_forced_tool
+
+
+def _request_after(tool_name, response):
+    """Build a model request whose latest turn is a single tool result."""
+    return LlmRequest(contents=[
+        types.Content(role="user", parts=[types.Part(text="stand")]),
+        types.Content(role="user", parts=[
+            types.Part(function_response=types.FunctionResponse(name=tool_name, response=response))
+        ])
+    ])
+
+
+class TestDealerAgent:
+    """Test the dealer agent factory."""
+
+    def test_instruction_is_stable_prefix(self):
+        """
+        Test that every agent lookup sends the same instruction object.
+        Expected result: Both lookups return the same agent whose instruction is DEALER_INSTRUCTION itself.
+        Mock values: None - builds the real agent.
+        Why: Provider prompt caching needs the system prompt to be identical on every turn.
+        """
+        first = get_dealer_agent()
+        second = get_dealer_agent()
+
+        assert first is second
+        assert first.instruction is DEALER_INSTRUCTION
+        assert second.instruction is DEALER_INSTRUCTION
+
+    def test_instruction_has_no_state_placeholders(self):
+        """
+        Test that the instruction contains no {placeholder} braces.
+        Expected result: No '{' or '}' characters in DEALER_INSTRUCTION.
+        Mock values: None.
+        Why: ADK substitutes session state into braces, which would change the prompt between turns.
+        """
+        assert "{" not in DEALER_INSTRUCTION
+        assert "}" not in DEALER_INSTRUCTION
+
+    def test_forced_tool_skips_model_when_round_must_finish(self):
+        """
+        Test that the callback answers with a playDealerAndSettle call when the rules force it.
+        Expected result: An LlmResponse whose only part is a FunctionCall to playDealerAndSettle with no args.
+        Mock values: processPlayerAction results for stand, bust and 21, and a startRoundWithBet result with blackjack.
+        Why: These turns have one legal move, so the model round trip is skipped.
+        """
+        forced = [
+            ("processPlayerAction", {"success": True, "action": "stand", "player_hand": {"total": 17, "is_bust": False}}),
+            ("processPlayerAction", {"success": True, "action": "hit", "player_hand": {"total": 24, "is_bust": True}}),
+            ("processPlayerAction", {"success": True, "action": "hit", "player_hand": {"total": 21, "is_bust": False}}),
+            ("startRoundWithBet", {"success": True, "player_hand": {"total": 21, "is_blackjack": True}}),
+        ]
+
+        for tool_name, response in forced:
+            result = _call_forced_tool(None, _request_after(tool_name, response))
+
+            assert isinstance(result, LlmResponse)
+            assert result.content.role == "model"
+            assert len(result.content.parts) == 1
+            function_call = result.content.parts[0].function_call
+            assert function_call.name == "playDealerAndSettle"
+            assert function_call.args == {}
+
+    def test_forced_tool_defers_to_model_otherwise(self):
+        """
+        Test that the callback returns None whenever the model has a decision to make.
+        Expected result: None for every request.
+        Mock values: Empty request, plain user text, a hit under 21, a normal deal, a failed stand, a displayState result and two tool results in one turn.
+        Why: Returning a response here would bypass the model; it must only do so on forced turns.
+        """
+        not_forced = [
+            LlmRequest(contents=[]),
+            LlmRequest(contents=[types.Content(role="user", parts=[types.Part(text="hit")])]),
+            _request_after("processPlayerAction", {"success": True, "action": "hit", "player_hand": {"total": 15, "is_bust": False}}),
+            _request_after("startRoundWithBet", {"success": True, "player_hand": {"total": 12, "is_blackjack": False}}),
+            _request_after("processPlayerAction", {"success": False, "error": "No active round", "action": "stand"}),
+            _request_after("displayState", {"success": True}),
+            LlmRequest(contents=[types.Content(role="user", parts=[
+                types.Part(function_response=types.FunctionResponse(name="processPlayerAction", response={"success": True, "action": "stand"})),
+                types.Part(function_response=types.FunctionResponse(name="displayState", response={"success": True})),
+            ])]),
+        ]
+
+        for request in not_forced:
+            assert _call_forced_tool(None, request) is None
@@ -2,16 +2,14 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from dealer_agent.tools.dealer import (
     placeBetAndDealInitialHands,
+    playDealerAndSettle,
     GameState,
     shuffleShoe,
-    Card,
-    Suit,
-    Rank,
-    Hand,
     reset_game_state,
     get_current_state,
     set_current_state
 )
+from dealer_agent.models import Card, Suit, Rank, Hand
 from google.adk.tools.tool_context import ToolContext
 
 
@@ -264,4 +262,243 @@ class TestAtomicOperations:
             
             # Verify state consistency
             total_cards = len(final_state.shoe) + len(final_state.player_hand.cards) + len(final_state.dealer_hand.cards)
-            assert total_cards == 312 
\ No newline at end of file
+            assert total_cards == 312 
+    
+    @pytest.mark.asyncio
+    async def test_play_dealer_and_settle_after_stand(self):
+        """
+        Test finishing a round after the player stands.
+        Expected result: Dealer draws to 17+, bet is settled, hands are cleared.
+        Mock values: Player 19, dealer 10+2, credit/save/session calls succeed.
+        Why: Verify dealer play and settlement run in one tool call.
+        """
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer.service_manager') as mock_service_manager:
+            mock_user_manager = AsyncMock()
+            mock_user_manager.get_user_balance.return_value = 900.0
+            mock_user_manager.credit_user_balance.return_value = True
+            
+            mock_db_service = AsyncMock()
+            mock_db_service.save_round.return_value = True
+            mock_db_service.update_session_status.return_value = True
+            
+            mock_service_manager.user_manager = mock_user_manager
+            mock_service_manager.db_service = mock_db_service
+            
+            state = GameState(
+                shoe=shuffleShoe(),
+                player_hand=Hand(cards=[
+                    Card(suit=Suit.hearts, rank=Rank.king),
+                    Card(suit=Suit.spades, rank=Rank.nine)  # 19 (stood)
+                ]),
+                dealer_hand=Hand(cards=[
+                    Card(suit=Suit.diamonds, rank=Rank.ten),
+                    Card(suit=Suit.clubs, rank=Rank.two)  # 12 (must hit)
+                ]),
+                bet=100.0
+            )
+            set_current_state(state)
+            
+            result = await playDealerAndSettle(tool_context)
+            
+            assert result["success"] is True
+            assert result["dealer_played"] is True
+            assert result["dealer_hand"]["total"] >= 17
+            assert result["result"] in ("win", "loss", "push")
+            mock_db_service.save_round.assert_called_once()
+            
+            final_state = get_current_state()
+            assert final_state.player_hand.cards == []
+            assert final_state.dealer_hand.cards == []
+    
+    @pytest.mark.asyncio
+    async def test_play_dealer_and_settle_skips_dealer_on_bust(self):
+        """
+        Test finishing a round after the player busts.
+        Expected result: Dealer does not draw, round settles as a loss with no payout.
+        Mock values: Player 25 (bust), dealer 10+5, save/session calls succeed.
+        Why: Verify the dealer's turn is skipped when the player has already lost.
+        """
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer.service_manager') as mock_service_manager:
+            mock_user_manager = AsyncMock()
+            mock_user_manager.get_user_balance.return_value = 900.0
+            
+            mock_db_service = AsyncMock()
+            mock_db_service.save_round.return_value = True
+            mock_db_service.update_session_status.return_value = True
+            
+            mock_service_manager.user_manager = mock_user_manager
+            mock_service_manager.db_service = mock_db_service
+            
+            shoe = shuffleShoe()
+            state = GameState(
+                shoe=shoe,
+                player_hand=Hand(cards=[
+                    Card(suit=Suit.hearts, rank=Rank.king),
+                    Card(suit=Suit.spades, rank=Rank.queen),
+                    Card(suit=Suit.diamonds, rank=Rank.five)  # 25 (bust)
+                ]),
+                dealer_hand=Hand(cards=[
+                    Card(suit=Suit.diamonds, rank=Rank.ten),
+                    Card(suit=Suit.clubs, rank=Rank.five)
+                ]),
+                bet=100.0
+            )
+            set_current_state(state)
+            remaining_before = len(state.shoe)
+            
+            result = await playDealerAndSettle(tool_context)
+            
+            assert result["success"] is True
+            assert result["dealer_played"] is False
+            assert result["result"] == "loss"
+            assert result["payout"] == 0.0
+            assert len(get_current_state().shoe) == remaining_before
+            mock_user_manager.credit_user_balance.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_play_dealer_and_settle_pays_blackjack_without_dealer_play(self):
+        """
+        Test finishing a round after the player is dealt blackjack.
+        Expected result: Dealer does not draw, round settles as a 3:2 win paying 25 on a 10 bet.
+        Mock values: Player A+K (blackjack), dealer 10+6 with a King on top of the shoe, bet 10.
+        Why: Drawing would bust the dealer, and a dealer bust must not downgrade a natural to an even-money win.
+        """
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer.service_manager') as mock_service_manager:
+            mock_user_manager = AsyncMock()
+            mock_user_manager.get_user_balance.return_value = 1015.0
+            mock_user_manager.credit_user_balance.return_value = True
+            
+            mock_db_service = AsyncMock()
+            mock_db_service.save_round.return_value = True
+            mock_db_service.update_session_status.return_value = True
+            
+            mock_service_manager.user_manager = mock_user_manager
+            mock_service_manager.db_service = mock_db_service
+            
+            shoe = shuffleShoe()
+            shoe[-1] = Card(suit=Suit.spades, rank=Rank.king)  # Next card drawn
+            state = GameState(
+                shoe=shoe,
+                player_hand=Hand(cards=[
+                    Card(suit=Suit.hearts, rank=Rank.ace),
+                    Card(suit=Suit.spades, rank=Rank.king)
+                ]),
+                dealer_hand=Hand(cards=[
+                    Card(suit=Suit.diamonds, rank=Rank.ten),
+                    Card(suit=Suit.clubs, rank=Rank.six)
+                ]),
+                bet=10.0
+            )
+            set_current_state(state)
+            remaining_before = len(state.shoe)
+            
+            result = await playDealerAndSettle(tool_context)
+            
+            assert result["success"] is True
+            assert result["dealer_played"] is False
+            assert result["result"] == "win"
+            assert result["payout"] == 25.0
+            assert len(get_current_state().shoe) == remaining_before
+            mock_user_manager.credit_user_balance.assert_awaited_once_with("test_user", 25.0)
+    
+    @pytest.mark.asyncio
+    async def test_play_dealer_and_settle_records_balances_read_around_credit(self):
+        """
+        Test that settling a win records the balances read before and after the credit.
+        Expected result: Two get_user_balance calls; round saved with chips_before 900 and chips_after 1100; session completed.
+        Mock values: Player K+Q (20), dealer 10+8 (18), bet 100, balance 900 before and 1100 after the credit.
+        Why: The round record must hold balances read from the database, not derived from the payout.
+        """
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer.service_manager') as mock_service_manager:
+            mock_user_manager = AsyncMock()
+            mock_user_manager.get_user_balance.side_effect = [900.0, 1100.0]
+            mock_user_manager.credit_user_balance.return_value = True
+            
+            mock_db_service = AsyncMock()
+            mock_db_service.save_round.return_value = True
+            mock_db_service.update_session_status.return_value = True
+            
+            mock_service_manager.user_manager = mock_user_manager
+            mock_service_manager.db_service = mock_db_service
+            
+            state = GameState(
+                shoe=shuffleShoe(),
+                player_hand=Hand(cards=[
+                    Card(suit=Suit.hearts, rank=Rank.king),
+                    Card(suit=Suit.spades, rank=Rank.queen)
+                ]),
+                dealer_hand=Hand(cards=[
+                    Card(suit=Suit.diamonds, rank=Rank.ten),
+                    Card(suit=Suit.clubs, rank=Rank.eight)
+                ]),
+                bet=100.0
+            )
+            set_current_state(state)
+            
+            result = await playDealerAndSettle(tool_context)
+            
+            assert result["success"] is True
+            assert result["result"] == "win"
+            assert result["balance"] == 1100.0
+            mock_user_manager.credit_user_balance.assert_awaited_once_with("test_user", 200.0)
+            assert mock_user_manager.get_user_balance.await_count == 2
+            
+            round_data = mock_db_service.save_round.call_args.args[0]
+            assert round_data["chips_before"] == 900.0
+            assert round_data["chips_after"] == 1100.0
+            mock_db_service.update_session_status.assert_awaited_once_with("test_session", "completed")
+    
+    @pytest.mark.asyncio
+    async def test_play_dealer_and_settle_keeps_session_open_when_save_fails(self):
+        """
+        Test that a failed round save leaves the session status untouched.
+        Expected result: Failure with a database error; update_session_status never awaited.
+        Mock values: Player K+Q (20), dealer 10+8 (18), bet 100, save_round returns False.
+        Why: A session must not be marked completed for a round that was never recorded.
+        """
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer.service_manager') as mock_service_manager:
+            mock_user_manager = AsyncMock()
+            mock_user_manager.get_user_balance.return_value = 1100.0
+            mock_user_manager.credit_user_balance.return_value = True
+            
+            mock_db_service = AsyncMock()
+            mock_db_service.save_round.return_value = False
+            mock_db_service.update_session_status.return_value = True
+            
+            mock_service_manager.user_manager = mock_user_manager
+            mock_service_manager.db_service = mock_db_service
+            
+            state = GameState(
+                shoe=shuffleShoe(),
+                player_hand=Hand(cards=[
+                    Card(suit=Suit.hearts, rank=Rank.king),
+                    Card(suit=Suit.spades, rank=Rank.queen)
+                ]),
+                dealer_hand=Hand(cards=[
+                    Card(suit=Suit.diamonds, rank=Rank.ten),
+                    Card(suit=Suit.clubs, rank=Rank.eight)
+                ]),
+                bet=100.0
+            )
+            set_current_state(state)
+            
+            result = await playDealerAndSettle(tool_context)
+            
+            assert result["success"] is False
+            assert "Failed to save round data" in result["error"]
+            mock_db_service.update_session_status.assert_not_awaited()
@@ -1,5 +1,5 @@
 import pytest
-from dealer_agent.tools.dealer import checkShoeExhaustion, GameState, shuffleShoe, set_current_state
+from dealer_agent.tools.dealer import checkShoeExhaustion, GameState, shuffleShoe, set_current_state, get_current_state, resetForNextHand
 
 
 class TestCheckShoeExhaustion:
@@ -48,4 +48,37 @@ class TestCheckShoeExhaustion:
         result = checkShoeExhaustion(threshold=20)
         
         assert result["success"] is True
-        assert result["is_exhausted"] is False 
\ No newline at end of file
+        assert result["is_exhausted"] is False 
+    
+    def test_reset_reshuffles_exhausted_shoe_in_place(self):
+        """
+        Test that resetForNextHand() refills an exhausted shoe without replacing the list.
+        Expected result: reshuffled is True, shoe is back to 312 cards and is the same list object.
+        Mock values: Shoe with 19 cards, below the default threshold of 50.
+        Why: Verify reshuffling reuses the existing shoe instead of allocating a new one.
+        """
+        state = GameState(shoe=shuffleShoe()[:19])
+        set_current_state(state)
+        shoe = state.shoe
+        
+        result = resetForNextHand()
+        
+        assert result["success"] is True
+        assert result["reshuffled"] is True
+        assert get_current_state().shoe is shoe
+        assert len(shoe) == 312
+    
+    def test_checks_passed_state(self):
+        """
+        Test that an explicitly passed state is checked instead of the current one.
+        Expected result: Exhausted with 10 remaining, although the current state has a full shoe.
+        Mock values: Current state with a full shoe; passed state with 10 cards, threshold = 20.
+        Why: Callers holding the state pass it to avoid a second fetch and validation.
+        """
+        set_current_state(GameState(shoe=shuffleShoe()))
+        low_state = GameState(shoe=shuffleShoe()[:10])
+        
+        result = checkShoeExhaustion(threshold=20, state=low_state)
+        
+        assert result["is_exhausted"] is True
+        assert result["remaining_cards"] == 10
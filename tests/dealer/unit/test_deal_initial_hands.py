@@ -1,5 +1,6 @@
 import pytest
-from dealer_agent.tools.dealer import dealInitialHands, GameState, shuffleShoe, Card, Suit, Rank, Hand, reset_game_state
+from dealer_agent.tools.dealer import dealInitialHands, GameState, shuffleShoe, reset_game_state
+from dealer_agent.models import Card, Suit, Rank, Hand
 
 
 class TestDealInitialHands:
@@ -58,4 +59,36 @@ class TestDealInitialHands:
         # Since we can't easily verify the exact order without more complex state inspection,
         # we just verify that 2 cards each were dealt
         assert len(result["player_hand"]["cards"]) == 2
-        assert result["remaining_cards"] == len(known_shoe) - 4  # 4 cards dealt 
\ No newline at end of file
+        assert result["remaining_cards"] == len(known_shoe) - 4  # 4 cards dealt 
+    
+    def test_deal_order_from_shoe_tail(self):
+        """
+        Test that the four cards at the end of the shoe land in player, dealer, player, dealer order.
+        Expected result: Player holds A♥ then Q♣, dealer holds K♦ then J♠, shoe loses exactly those 4 cards.
+        Mock values: Shuffled shoe with four known cards appended at the end.
+        Why: Verify batch dealing keeps the standard alternating order.
+        """
+        from dealer_agent.tools.dealer import set_current_state, get_current_state
+        base_shoe = shuffleShoe()[4:]
+        known_shoe = base_shoe + [
+            Card(suit=Suit.spades, rank=Rank.jack),
+            Card(suit=Suit.clubs, rank=Rank.queen),
+            Card(suit=Suit.diamonds, rank=Rank.king),
+            Card(suit=Suit.hearts, rank=Rank.ace),
+        ]
+        set_current_state(GameState(shoe=known_shoe))
+        
+        result = dealInitialHands()
+        
+        assert result["success"] is True
+        state = get_current_state()
+        assert state.player_hand.cards == [
+            Card(suit=Suit.hearts, rank=Rank.ace),
+            Card(suit=Suit.clubs, rank=Rank.queen),
+        ]
+        assert state.dealer_hand.cards == [
+            Card(suit=Suit.diamonds, rank=Rank.king),
+            Card(suit=Suit.spades, rank=Rank.jack),
+        ]
+        assert result["dealer_up_card"] == {"suit": "D", "rank": "K"}
+        assert state.shoe == base_shoe
@@ -1,5 +1,6 @@
 import pytest
-from dealer_agent.tools.dealer import evaluateHand, Hand, Card, Suit, Rank
+from dealer_agent.tools.dealer import evaluateHand, add_card
+from dealer_agent.models import Hand, Card, Suit, Rank
 
 
 class TestEvaluateHand:
@@ -139,4 +140,95 @@ class TestEvaluateHand:
         assert result.total == 13
         assert result.is_soft is False
         assert result.is_blackjack is False
-        assert result.is_bust is False 
\ No newline at end of file
+        assert result.is_bust is False 
+    
+    def test_incremental_add_card(self):
+        """
+        Test that evaluating between card additions matches a fresh evaluation.
+        Expected result: Soft 17 after [A♣, 6♦], hard 17 after adding K♥.
+        Mock values: Hand built card by card with add_card().
+        Why: Verify running totals stay correct as cards are added one at a time.
+        """
+        hand = Hand()
+        add_card(hand, Card(suit=Suit.clubs, rank=Rank.ace))
+        add_card(hand, Card(suit=Suit.diamonds, rank=Rank.six))
+        
+        result = evaluateHand(hand)
+        assert result.total == 17
+        assert result.is_soft is True
+        
+        add_card(hand, Card(suit=Suit.hearts, rank=Rank.king))
+        
+        result = evaluateHand(hand)
+        assert result.total == 17
+        assert result.is_soft is False
+        assert result == evaluateHand(Hand(cards=list(hand.cards)))
+    
+    def test_cards_replaced_after_evaluation(self):
+        """
+        Test that shrinking a hand's cards after evaluation is picked up.
+        Expected result: Total 2 after replacing a 20 with [2♣].
+        Mock values: Hand [K♠, Q♥] evaluated, then cards replaced.
+        Why: Verify running totals are recounted when cards are removed.
+        """
+        hand = Hand(cards=[
+            Card(suit=Suit.spades, rank=Rank.king),
+            Card(suit=Suit.hearts, rank=Rank.queen)
+        ])
+        assert evaluateHand(hand).total == 20
+        
+        hand.cards = [Card(suit=Suit.clubs, rank=Rank.two)]
+        
+        assert evaluateHand(hand).total == 2
+    
+    def test_cards_replaced_at_same_or_longer_length(self):
+        """
+        Test that replacing a hand's cards without shrinking it is picked up.
+        Expected result: 21 after [K♠, Q♥] becomes [A♦, K♠], 9 after it becomes [2♣, 3♣, 4♣].
+        Mock values: Hand [K♠, Q♥] evaluated, then its card list reassigned twice.
+        Why: A stale cached total would misreport blackjack or bust.
+        """
+        hand = Hand(cards=[
+            Card(suit=Suit.spades, rank=Rank.king),
+            Card(suit=Suit.hearts, rank=Rank.queen)
+        ])
+        assert evaluateHand(hand).total == 20
+        
+        hand.cards = [
+            Card(suit=Suit.diamonds, rank=Rank.ace),
+            Card(suit=Suit.spades, rank=Rank.king)
+        ]
+        result = evaluateHand(hand)
+        assert result.total == 21
+        assert result.is_blackjack is True
+        
+        hand.cards = [
+            Card(suit=Suit.clubs, rank=Rank.two),
+            Card(suit=Suit.clubs, rank=Rank.three),
+            Card(suit=Suit.clubs, rank=Rank.four)
+        ]
+        result = evaluateHand(hand)
+        assert result.total == 9
+        assert result.is_bust is False
+    
+    def test_evaluation_reused_until_hand_changes(self):
+        """
+        Test that an unchanged hand returns its cached evaluation.
+        Expected result: Same object on repeat calls; a fresh 21 after another card is appended.
+        Mock values: Hand [5♣, 6♦], then 10♠ appended directly to the card list.
+        Why: Tool payloads evaluate the same hand several times per call; any new card must invalidate the cache.
+        """
+        hand = Hand(cards=[
+            Card(suit=Suit.clubs, rank=Rank.five),
+            Card(suit=Suit.diamonds, rank=Rank.six)
+        ])
+        
+        first = evaluateHand(hand)
+        assert evaluateHand(hand) is first
+        
+        hand.cards.append(Card(suit=Suit.spades, rank=Rank.ten))
+        
+        result = evaluateHand(hand)
+        assert result is not first
+        assert result.total == 21
+        assert result.is_blackjack is False
@@ -0,0 +1,74 @@
+from dealer_agent.policy import next_tool, FINISH_ROUND_TOOL
+
+
+class TestNextTool:
+    """Test the deterministic turn policy."""
+
+    def test_stand_finishes_round(self):
+        """
+        Test that a successful stand forces the finishing tool.
+        Expected result: playDealerAndSettle is returned.
+        Mock values: processPlayerAction response with action "stand" and a 17 total.
+        Why: After standing the dealer must play; the model has nothing to decide.
+        """
+        response = {"success": True, "action": "stand", "player_hand": {"total": 17, "is_bust": False}}
+
+        assert next_tool("processPlayerAction", response) == FINISH_ROUND_TOOL
+
+    def test_bust_finishes_round(self):
+        """
+        Test that busting on a hit forces the finishing tool.
+        Expected result: playDealerAndSettle is returned.
+        Mock values: processPlayerAction response with action "hit" and a bust hand.
+        Why: A bust player cannot act again, so the round must be settled.
+        """
+        response = {"success": True, "action": "hit", "player_hand": {"total": 24, "is_bust": True}}
+
+        assert next_tool("processPlayerAction", response) == FINISH_ROUND_TOOL
+
+    def test_twenty_one_finishes_round(self):
+        """
+        Test that hitting to exactly 21 forces the finishing tool.
+        Expected result: playDealerAndSettle is returned.
+        Mock values: processPlayerAction response with action "hit" and a 21 total.
+        Why: The rules auto-stand on 21.
+        """
+        response = {"success": True, "action": "hit", "player_hand": {"total": 21, "is_bust": False}}
+
+        assert next_tool("processPlayerAction", response) == FINISH_ROUND_TOOL
+
+    def test_hit_under_21_needs_player(self):
+        """
+        Test that a hit leaving the player under 21 defers to the model.
+        Expected result: None.
+        Mock values: processPlayerAction response with action "hit" and a 15 total.
+        Why: The player must choose to hit or stand again.
+        """
+        response = {"success": True, "action": "hit", "player_hand": {"total": 15, "is_bust": False}}
+
+        assert next_tool("processPlayerAction", response) is None
+
+    def test_dealt_blackjack_finishes_round(self):
+        """
+        Test that a natural blackjack on the deal forces the finishing tool, and a normal deal does not.
+        Expected result: playDealerAndSettle for blackjack, None otherwise.
+        Mock values: startRoundWithBet responses with and without is_blackjack.
+        Why: A player with blackjack has no decision to make.
+        """
+        blackjack = {"success": True, "player_hand": {"total": 21, "is_blackjack": True}}
+        normal = {"success": True, "player_hand": {"total": 12, "is_blackjack": False}}
+
+        assert next_tool("startRoundWithBet", blackjack) == FINISH_ROUND_TOOL
+        assert next_tool("startRoundWithBet", normal) is None
+
+    def test_failed_response_defers_to_model(self):
+        """
+        Test that an unsuccessful tool result never forces a tool.
+        Expected result: None for failed and unrelated tool results.
+        Mock values: Failed stand response and a displayState response.
+        Why: Errors have to be explained to the player by the model.
+        """
+        failed = {"success": False, "error": "No active round", "action": "stand"}
+
+        assert next_tool("processPlayerAction", failed) is None
+        assert next_tool("displayState", {"success": True}) is None
@@ -1,5 +1,6 @@
 import pytest
-from dealer_agent.tools.dealer import processDealerPlay, GameState, shuffleShoe, Card, Suit, Rank, Hand, reset_game_state
+from dealer_agent.tools.dealer import processDealerPlay, GameState, shuffleShoe, reset_game_state
+from dealer_agent.models import Card, Suit, Rank, Hand
 
 
 class TestProcessDealerPlay:
@@ -94,4 +95,36 @@ class TestProcessDealerPlay:
         
         assert result["success"] is True
         assert result["dealer_hand"]["total"] == 17  # Should still be 17
-        assert len(result["dealer_hand"]["cards"]) == 2  # No additional cards drawn 
\ No newline at end of file
+        assert len(result["dealer_hand"]["cards"]) == 2  # No additional cards drawn 
+    
+    def test_soft_hand_keeps_drawing_after_ace_turns_hard(self):
+        """
+        Test that a soft 16 which turns into hard 16 keeps drawing.
+        Expected result: Dealer draws 10 then 2, finishing on hard 18 with 4 cards.
+        Mock values: Dealer hand [A, 5], shoe ending in 2 then 10 (10 drawn first), player bust.
+        Why: Verify the dealer loop re-counts the ace as 1 once 11 would bust.
+        """
+        from dealer_agent.tools.dealer import set_current_state
+        state = GameState(
+            shoe=shuffleShoe()[2:] + [
+                Card(suit=Suit.clubs, rank=Rank.two),
+                Card(suit=Suit.spades, rank=Rank.ten),
+            ],
+            player_hand=Hand(cards=[
+                Card(suit=Suit.hearts, rank=Rank.king),
+                Card(suit=Suit.spades, rank=Rank.queen),
+                Card(suit=Suit.clubs, rank=Rank.five)
+            ]),
+            dealer_hand=Hand(cards=[
+                Card(suit=Suit.hearts, rank=Rank.ace),
+                Card(suit=Suit.diamonds, rank=Rank.five)
+            ])
+        )
+        set_current_state(state)
+        
+        result = processDealerPlay()
+        
+        assert result["success"] is True
+        assert len(result["dealer_hand"]["cards"]) == 4
+        assert result["dealer_hand"]["total"] == 18
+        assert result["dealer_hand"]["is_soft"] is False
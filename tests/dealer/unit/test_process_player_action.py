@@ -1,5 +1,6 @@
 import pytest
-from dealer_agent.tools.dealer import processPlayerAction, GameState, shuffleShoe, Card, Suit, Rank, Hand, reset_game_state
+from dealer_agent.tools.dealer import processPlayerAction, GameState, shuffleShoe, reset_game_state
+from dealer_agent.models import Card, Suit, Rank, Hand
 
 
 class TestProcessPlayerAction:
@@ -94,4 +95,31 @@ class TestProcessPlayerAction:
         
         assert result["success"] is True
         assert len(result["player_hand"]["cards"]) == 3  # 2 original + 1 hit
-        assert result["remaining_cards"] == 311  # 312 - 1 card drawn 
\ No newline at end of file
+        assert result["remaining_cards"] == 311  # 312 - 1 card drawn     
+    def test_hit_on_empty_shoe(self):
+        """
+        Test that hitting with an empty shoe fails without changing the hand.
+        Expected result: success=False with the empty-shoe error; player hand keeps 2 cards.
+        Mock values: State with an empty shoe, player hand [10♥, 5♦] and a placed bet.
+        Why: Verify the inlined draw reports an exhausted shoe instead of raising.
+        """
+        from dealer_agent.tools.dealer import set_current_state
+        state = GameState(
+            shoe=[],
+            player_hand=Hand(cards=[
+                Card(suit=Suit.hearts, rank=Rank.ten),
+                Card(suit=Suit.diamonds, rank=Rank.five)
+            ]),
+            dealer_hand=Hand(cards=[
+                Card(suit=Suit.spades, rank=Rank.ace),
+                Card(suit=Suit.clubs, rank=Rank.king)
+            ]),
+            bet=100.0
+        )
+        set_current_state(state)
+        
+        result = processPlayerAction('hit')
+        
+        assert result["success"] is False
+        assert result["error"] == "Shoe is empty, cannot draw card"
+        assert len(state.player_hand.cards) == 2
@@ -1,5 +1,6 @@
 import pytest
-from dealer_agent.tools.dealer import shuffleShoe, Suit, Rank
+from dealer_agent.tools.dealer import shuffleShoe, reseed
+from dealer_agent.models import Suit, Rank
 
 
 class TestShuffleShoe:
@@ -43,4 +44,36 @@ class TestShuffleShoe:
         shoe1_str = [f"{card.rank}{card.suit}" for card in shoe1[:10]]  # First 10 cards
         shoe2_str = [f"{card.rank}{card.suit}" for card in shoe2[:10]]
         
-        assert shoe1_str != shoe2_str 
\ No newline at end of file
+        assert shoe1_str != shoe2_str 
+    def test_shares_canonical_cards(self):
+        """
+        Test that shuffleShoe() reuses the 52 canonical cards instead of building new ones.
+        Expected result: The shoe references exactly 52 distinct card objects.
+        Mock values: None - using actual function to generate shoes.
+        Why: Reshuffling should not allocate a fresh card object per shoe slot.
+        """
+        shoe1 = shuffleShoe()
+        shoe2 = shuffleShoe()
+        
+        assert len({id(card) for card in shoe1}) == 52
+        assert {id(card) for card in shoe1} == {id(card) for card in shoe2}
+    
+    def test_reseed_repeats_shuffle(self):
+        """
+        Test that reseed() with the same seed reproduces the same shoe order.
+        Expected result: Two shoes shuffled after reseed(1234) are identical; a different seed differs.
+        Mock values: Seeds 1234 and 4321.
+        Why: Tests rely on reseed() for reproducible dealing.
+        """
+        try:
+            reseed(1234)
+            first = shuffleShoe()
+            reseed(1234)
+            second = shuffleShoe()
+            reseed(4321)
+            third = shuffleShoe()
+        finally:
+            reseed()
+        
+        assert first == second
+        assert first != third
@@ -19,8 +19,8 @@ class TestStartRoundWithBet:
         # Setup mocks
         mock_user_manager = AsyncMock()
         mock_service_manager.user_manager = mock_user_manager
-        # Provide enough return values for multiple calls to get_user_balance
-        mock_user_manager.get_user_balance.side_effect = [1000.0, 1000.0, 975.0, 975.0]
+        # Balance before the bet, then after the debit
+        mock_user_manager.get_user_balance.side_effect = [1000.0, 975.0]
         mock_user_manager.debit_user_balance.return_value = True
         
         # Setup tool context
@@ -273,6 +273,82 @@ class TestStartRoundWithBet:
         assert result["success"] is False
         assert "Bet amount must be a multiple of 5" in result["error"]
     
+    @pytest.mark.asyncio
+    @patch('dealer_agent.tools.dealer.service_manager')
+    async def test_start_round_with_bet_ignores_float_noise(self, mock_service_manager):
+        """Test a bet carrying float noise is accepted and debited as whole cents."""
+        mock_user_manager = AsyncMock()
+        mock_service_manager.user_manager = mock_user_manager
+        mock_user_manager.get_user_balance.return_value = 975.0
+        mock_user_manager.debit_user_balance.return_value = True
+        
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        result = await startRoundWithBet(25.000000001, tool_context)
+        
+        assert result["success"] is True
+        assert result["bet"] == 25.0
+        mock_user_manager.debit_user_balance.assert_called_once_with("test_user", 25.0)
+    
+    @pytest.mark.asyncio
+    @patch('dealer_agent.tools.dealer.service_manager')
+    async def test_start_round_with_bet_rejects_sub_cent_amount(self, mock_service_manager):
+        """Test a bet that is not a whole number of cents is rejected, not rounded."""
+        mock_user_manager = AsyncMock()
+        mock_service_manager.user_manager = mock_user_manager
+        mock_user_manager.get_user_balance.return_value = 1000.0
+        mock_user_manager.debit_user_balance.return_value = True
+        
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        result = await startRoundWithBet(25.004, tool_context)
+        
+        assert result["success"] is False
+        assert "Bet amount must be in whole cents" in result["error"]
+        mock_user_manager.debit_user_balance.assert_not_called()
+    
+    @pytest.mark.asyncio
+    @patch('dealer_agent.tools.dealer.service_manager')
+    async def test_start_round_with_bet_refunds_normalised_amount(self, mock_service_manager):
+        """Test a rollback refunds the debited whole-cent amount, not the caller's raw float."""
+        mock_user_manager = AsyncMock()
+        mock_service_manager.user_manager = mock_user_manager
+        mock_user_manager.get_user_balance.return_value = 1000.0
+        mock_user_manager.debit_user_balance.return_value = True
+        mock_user_manager.credit_user_balance.return_value = True
+        
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer._validate_player_turn_ready') as mock_validate:
+            mock_validate.return_value = False
+            
+            result = await startRoundWithBet(25.000000001, tool_context)
+        
+        assert result["success"] is False
+        mock_user_manager.debit_user_balance.assert_called_once_with("test_user", 25.0)
+        mock_user_manager.credit_user_balance.assert_called_once_with("test_user", 25.0)
+    
+    @pytest.mark.asyncio
+    @patch('dealer_agent.tools.dealer.service_manager')
+    async def test_start_round_with_bet_reads_balance_before_and_after_debit(self, mock_service_manager):
+        """Test the balance is read once before the bet and once after the debit, and the latter is reported."""
+        mock_user_manager = AsyncMock()
+        mock_service_manager.user_manager = mock_user_manager
+        mock_user_manager.get_user_balance.side_effect = [1000.0, 970.0]  # Another debit landed concurrently
+        mock_user_manager.debit_user_balance.return_value = True
+        
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        result = await startRoundWithBet(25.0, tool_context)
+        
+        assert result["success"] is True
+        assert result["balance"] == 970.0
+        assert mock_user_manager.get_user_balance.await_count == 2
+    
     @pytest.mark.asyncio
     @patch('dealer_agent.tools.dealer.service_manager')
     async def test_start_round_with_bet_handles_network_failure(self, mock_service_manager):
@@ -6,14 +6,11 @@ from dealer_agent.tools.dealer import (
     settleBet,
     GameState,
     shuffleShoe,
-    Card,
-    Suit,
-    Rank,
-    Hand,
     reset_game_state,
     get_current_state,
     set_current_state
 )
+from dealer_agent.models import Card, Suit, Rank, Hand
 from google.adk.tools.tool_context import ToolContext
 
 
@@ -402,6 +399,50 @@ class TestValidationEnforcement:
             assert result["result"] == "win"  # Player 19 beats dealer 18
             assert result["payout"] == 200.0  # Get bet back + winnings
     
+    @pytest.mark.asyncio
+    async def test_settle_bet_blackjack_beats_dealer_bust_at_3_to_2(self):
+        """
+        Test that a player blackjack is paid 3:2 even when the dealer busted.
+        Expected result: Success, a win paying 25 on a 10 bet.
+        Mock values: Player A+K (blackjack), dealer 10+6+K (26, bust), bet 10.
+        Why: A dealer bust must not shadow the blackjack payout with an even-money win.
+        """
+        tool_context = MagicMock()
+        tool_context.state = {"user_id": "test_user", "session_id": "test_session"}
+        
+        with patch('dealer_agent.tools.dealer.service_manager') as mock_service_manager:
+            mock_user_manager = AsyncMock()
+            mock_user_manager.get_user_balance.return_value = 990.0  # Balance after bet
+            mock_user_manager.credit_user_balance.return_value = True
+            
+            mock_db_service = AsyncMock()
+            mock_db_service.save_round.return_value = True
+            mock_db_service.update_session_status.return_value = True
+            
+            mock_service_manager.user_manager = mock_user_manager
+            mock_service_manager.db_service = mock_db_service
+            
+            state = GameState(
+                shoe=shuffleShoe(),
+                player_hand=Hand(cards=[
+                    Card(suit=Suit.hearts, rank=Rank.ace),
+                    Card(suit=Suit.spades, rank=Rank.king)  # Blackjack
+                ]),
+                dealer_hand=Hand(cards=[
+                    Card(suit=Suit.diamonds, rank=Rank.ten),
+                    Card(suit=Suit.clubs, rank=Rank.six),
+                    Card(suit=Suit.hearts, rank=Rank.king)  # 26 (bust)
+                ]),
+                bet=10.0
+            )
+            set_current_state(state)
+            
+            result = await settleBet(tool_context)
+            
+            assert result["success"] is True
+            assert result["result"] == "win"
+            assert result["payout"] == 25.0  # Bet back + 3:2 winnings
+    
     # ===== Edge case validation tests =====
     
     def test_validation_with_corrupted_state(self):
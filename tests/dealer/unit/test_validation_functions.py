@@ -8,12 +8,9 @@ from dealer_agent.tools.dealer import (
     GameState,
     GameStateValidationError,
     shuffleShoe,
-    Card,
-    Suit,
-    Rank,
-    Hand,
     reset_game_state
 )
+from dealer_agent.models import Card, Suit, Rank, Hand
 
 
 class TestValidationFunctions:
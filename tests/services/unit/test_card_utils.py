@@ -8,7 +8,8 @@ from services.card_utils import (
     card_to_string, string_to_card, hand_to_string, string_to_hand,
     hand_to_dict, dict_to_hand
 )
-from dealer_agent.tools.dealer import Card, Hand, Suit, Rank
+from dealer_agent.models import Card, Hand, Suit, Rank
+from dealer_agent.models import CANONICAL_DECK
 
 
 @pytest.mark.unit
@@ -201,6 +202,20 @@ class TestCardConversion:
             
             assert converted_card.suit == original_card.suit
             assert converted_card.rank == original_card.rank
+    
+    def test_string_to_card_returns_canonical_cards(self):
+        """Test parsed cards are the shared canonical instances, not new objects."""
+        for card in CANONICAL_DECK:
+            assert string_to_card(card_to_string(card)) is card
+    
+    def test_card_string_fields_match_enum_values(self):
+        """Test the cached suit/rank strings match the enums and are ignored by equality."""
+        card = Card(suit=Suit.diamonds, rank=Rank.ten)
+        
+        assert card.suit_str == Suit.diamonds.value
+        assert card.rank_str == Rank.ten.value
+        assert card == Card(suit=Suit.diamonds, rank=Rank.ten)
+        assert card_to_string(card) == "10D"
 
 
 @pytest.mark.unit
@@ -73,6 +73,44 @@ class TestConfig:
         finally:
             cleanup_test_environment()
     
+    def test_log_level_normalised(self):
+        """Test lowercase log levels are accepted and normalised to uppercase."""
+        from tests.test_helpers import setup_test_environment, cleanup_test_environment
+        
+        setup_test_environment()
+        
+        try:
+            os.environ['LOGGING__LEVEL'] = 'warning'
+            
+            config = load_config()
+            
+            assert config.logging.level == 'WARNING'
+            
+        finally:
+            cleanup_test_environment()
+    
+    def test_config_requires_privy_credentials(self):
+        """Test configuration loading fails without Privy credentials."""
+        from tests.test_helpers import setup_test_environment, cleanup_test_environment
+        
+        setup_test_environment()
+        
+        try:
+            del os.environ['PRIVY__APP_ID']
+            del os.environ['PRIVY__APP_SECRET']
+            
+            with pytest.raises(ValueError, match="app_id"):
+                load_config()
+            
+            # An empty value is rejected as well
+            os.environ['PRIVY__APP_ID'] = ''
+            os.environ['PRIVY__APP_SECRET'] = 'secret'
+            with pytest.raises(ValueError, match="app_id"):
+                load_config()
+                
+        finally:
+            cleanup_test_environment()
+    
     def test_config_defaults(self):
         """Test configuration defaults."""
         from tests.test_helpers import setup_test_environment, cleanup_test_environment
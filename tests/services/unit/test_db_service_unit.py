@@ -3,7 +3,7 @@ Unit tests for database service utilities.
 """
 import pytest
 from services.card_utils import card_to_string, string_to_card, hand_to_string, string_to_hand
-from dealer_agent.tools.dealer import Card, Hand, Suit, Rank
+from dealer_agent.models import Card, Hand, Suit, Rank
 
 
 @pytest.mark.unit
@@ -11,6 +11,16 @@ from config import load_config, get_config
 class TestDotenvConfig:
     """Test dotenv integration with configuration system."""
     
+    def setup_method(self):
+        """Provide the Privy credentials every configuration load requires."""
+        os.environ['PRIVY__APP_ID'] = 'test_app_id'
+        os.environ['PRIVY__APP_SECRET'] = 'test_app_secret'
+    
+    def teardown_method(self):
+        """Remove the Privy credentials set in setup_method."""
+        os.environ.pop('PRIVY__APP_ID', None)
+        os.environ.pop('PRIVY__APP_SECRET', None)
+    
     def test_dotenv_loading(self):
         """Test that dotenv loads environment variables from .env file."""
         